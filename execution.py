@@ -18,7 +18,7 @@ Upon execution, the program connects to the specified SQLite3 database (creating
 and repeatedly displays a menu to the user for task management until they choose to exit.
 
 Functions:
-- execute_choice(value, task_list): Executes the task operation based on user input, validating choices as needed.
+- show_tasks(task_list): Prints all tasks, or a notice when there are none.
 - run_application(db_name): Initializes and runs the to-do application using the specified SQLite3 database.
 
 Dependencies:
@@ -41,51 +41,44 @@ database_name = sys.argv[1]
 
 
 
-def execute_choice (value, task_list):
-    if value == "5":
-        print ("You exit the program. Bye!")
+def show_tasks (task_list):
+    # One write for the whole list instead of one print per task.
+    text = "\n".join(task_list.formatted_tasks ())
 
-    elif value == "4":
-        task_list.delete_task ()
-        print ()
-        task_list.print_menu ()
-        
-        
-    elif value == "3":
-        task_list.change_priority ()
-        print ()
-        task_list.print_menu ()
-        
-        
-    elif value == "2":
-        task_list.add_task ()
-        print ()
-        task_list.print_menu ()
-        
-
-    elif value == "1":
-        _, records = task_list.show_tasks ()
-        
-        if len(records) == 0:
-            print ("There is no task. ")
-        for record in records:
-            print (record)
-        print()
-        task_list.print_menu ()
-       
+    if text == "":
+        print ("There is no task. ")
+    else:
+        sys.stdout.write(text + "\n")
 
 
 def run_application (db_name):
     new_todo = todo.ToDo(db_name) # Creating db if db in not exsisted, connecting otherwise
-    new_todo.print_menu()
-
-    while True:
-        choice = new_todo.read_user_choice ()
-        if choice == "5" :
-            print ("You exit the program. Bye!")
-            sys.exit(0)
-        else:
-            execute_choice(choice, new_todo)
+    # Bind the methods used on every cycle to locals once, outside the loop.
+    read_choice = new_todo.read_user_choice
+    print_menu = new_todo.print_menu
+    # Menu choices mapped to their handlers, so a choice is one dict lookup.
+    # read_user_choice only returns valid choices, so every other value has a handler.
+    dispatch = {
+        "1": lambda: show_tasks(new_todo),
+        "2": new_todo.add_task,
+        "3": new_todo.change_priority,
+        "4": new_todo.delete_task,
+    }
+
+    # Close the database on every exit path, including EOF and Ctrl-C at a prompt.
+    try:
+        while True:
+            print_menu()
+            choice = read_choice()
+            if choice == "5":
+                break
+            dispatch[choice]()
+            print()
+
+        print ("You exit the program. Bye!")
+    finally:
+        new_todo.close()
+    sys.exit(0)
             
 
     
@@ -14,11 +14,12 @@ Classes:
 
 Methods:
 - create_task_table: Ensures the tasks table exists in the database.
-- validate_priority, validate_task_name, validate_id: Validate task attributes 
+- validate_priority, validate_task_name, parse_id: Validate task attributes 
   for data quality and consistency.
-- show_tasks, find_task: Retrieve tasks or check if a specific task exists.
+- formatted_tasks, find_task: Retrieve tasks or check if a specific task exists.
 - change_priority, add_task, delete_task: Perform task operations with user input 
   and data validation.
+- add_tasks_bulk, delete_tasks: Insert or delete several tasks in one transaction.
 - print_menu, read_user_choice: Display the menu and handle user input choices.
 
 Usage:
@@ -28,6 +29,38 @@ Usage:
 
 import sqlite3
 import sys
+from urllib.parse import quote
+
+# Header and menu options, built once and written out with a single call.
+_MENU_TEXT = "\n".join([
+    "+" + "-" * 50 + "+",
+    "|                  ToDo Application                |",
+    "+" + "-" * 50 + "+",
+    "M E N U",
+    "1. Show tasks",
+    "2. Add Task",
+    "3. Change priority",
+    "4. Delete task",
+    "5. Exit",
+]) + "\n"
+
+_VALID_CHOICES = frozenset("12345")
+
+
+def _parse_int(text):
+    """
+    Converts text to an integer without going through int()'s ValueError on bad input.
+
+    Parameters:
+    - text (str): The stripped text input by the user.
+
+    Returns:
+    - int: The integer value if the text is a plain, optionally signed, number; otherwise, None.
+    """
+    digits = text[1:] if text[:1] in ("-", "+") else text
+    if digits.isascii() and digits.isdigit():
+        return int(text)
+    return None
 
 class ToDo:
     """
@@ -39,22 +72,73 @@ class ToDo:
     Methods:
     - create_new_todo: Establishes a connection to the database.
     - create_task_table: Creates a tasks table if it doesn't already exist.
+    - close: Closes the connection to the database.
     """
 
+    # Fixed statements, kept verbatim so sqlite3's statement cache reuses the compiled bytecode.
+    _sql_select_formatted = "SELECT printf('%4d | %-30s | %d', id, name, priority) FROM tasks ORDER BY priority, id"
+    _sql_select_names = "SELECT id, name FROM tasks"
+    _sql_find_name = "SELECT id, name, priority FROM tasks WHERE name = ? COLLATE NOCASE LIMIT 1"
+    _sql_insert = "INSERT INTO tasks (name, priority) VALUES (?, ?)"
+    _sql_update_priority = "UPDATE tasks SET priority = ? WHERE id = ?"
+    _sql_select_newest = "SELECT id, name FROM tasks ORDER BY id DESC LIMIT ?"
+
     def __init__(self, db_name):
         self.create_new_todo(db_name)
         self.c = self.conn.cursor()
         self.create_task_table ()
+        self.load_task_cache ()
 
     def create_new_todo(self, db_name):
-        self.conn = sqlite3.connect(db_name)
+        # Open through a URI so the open mode is explicit: read-write, created if missing.
+        db_uri = "file::memory:" if db_name == ":memory:" else f"file:{quote(db_name)}?mode=rwc"
+        self.conn = sqlite3.connect(db_uri, uri=True, cached_statements=64)
+        # Larger pages only apply to a new, empty database and must be set before WAL is enabled.
+        self.conn.execute("PRAGMA page_size=8192")
+        # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+        # avoids an fsync on every commit. An in-memory database has no journal file.
+        if db_name != ":memory:":
+            journal_mode = self.conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if journal_mode.lower() != "wal":
+                print (f'Could not enable WAL mode, using "{journal_mode}" journal mode.')
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        # Keep up to 64 MiB of pages cached and read the file through a 256 MiB memory map.
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+
+    def close(self):
+        """
+        Closes the database connection.
+
+        Lets SQLite refresh its query planner statistics first; closing the last connection also checkpoints the WAL back into the database file.
+        """
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
 
     def create_task_table(self):
         self.c.execute("""CREATE TABLE IF NOT EXISTS tasks(
                             id INTEGER PRIMARY KEY,
-                            name TEXT NOT NULL,
+                            name TEXT NOT NULL COLLATE NOCASE,
                             priority INTEGER NOT NULL);""")
+        # Task names are unique through this one index, for new and existing databases alike.
+        try:
+            self.c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_name ON tasks(name COLLATE NOCASE)")
+        except sqlite3.IntegrityError:
+            print ("Duplicate task names found, the unique index on task names has not been created.")
+        # Covering index, so listing tasks by priority needs neither the table nor a sort.
+        self.c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_pri ON tasks(priority, id, name)")
     
+    def load_task_cache(self):
+        """
+        Loads the ids and names of all tasks into memory so validation does not query the database.
+
+        Names are kept lower-cased to match the case-insensitive uniqueness of the name column. The cache only tracks writes made through this connection; it is reloaded when a write fails because another connection changed the tasks, and a cached name is checked against the database before it is rejected.
+        """
+        self._names_by_id = {id: name.lower() for id, name in self.c.execute(self._sql_select_names)}
+        self._name_set = set(self._names_by_id.values())
+
     def validate_priority (self, priority):
         """
         Validates and converts the priority input to an integer within the allowed range.
@@ -66,15 +150,12 @@ class ToDo:
         - int: The priority as an integer if valid, otherwise None with an error message.
         """
 
-        try:
-            if priority == "":
-                raise ValueError('Priority must not be empty. Enter the priority!')
-        except ValueError as e:
-            print (e)
+        priority = priority.strip()
+        if priority == "":
+            print ('Priority must not be empty. Enter the priority!')
             return None
-        try:
-            priority = int(priority)
-        except ValueError as e:
+        priority = _parse_int(priority)
+        if priority is None:
             print ('Invalid input. Please enter a number between 1..10 inclusive.')
             return None
 
@@ -101,7 +182,11 @@ class ToDo:
                 raise ValueError ("Task name must not be empty.")
                 
             # Validate is the name already in the task list. 
-            if self.find_task(name):
+            if name.lower() in self._name_set:
+                # The cache may be stale if another connection deleted the task.
+                if self.find_task(name) is None:
+                    self.load_task_cache()
+                    return name
                 raise ValueError (f"The {name} is already in the todo list.")
         except ValueError as e:
             print (e)
@@ -110,85 +195,66 @@ class ToDo:
             return name
 
 
-    def validate_id (self, id):
+    def parse_id (self, id):
         """
-        Validates a task ID, ensuring it is not empty, is an integer, and exists in the database.
+        Validates that a task ID is not empty and is an integer that SQLite can store, without checking that it exists.
 
         Parameters:
         - id (str): The task ID input by the user.
 
         Returns:
-        - int: The validated ID if it is valid and exists in the database; otherwise, None with an error message.
+        - int: The ID as an integer if valid; otherwise, None with an error message.
         """
 
-        try:
-            if id == "":
-                raise ValueError ("the id must not be empty. Please enter an id! ")
-        except ValueError as e:
-            print (e)
+        id = id.strip()
+        if id == "":
+            print ("the id must not be empty. Please enter an id! ")
             return None
-        try:
-            id = int(id)
-        except ValueError:
+        id = _parse_int(id)
+        if id is None:
             print ("Invalid id. Please enter a integer number")
             return None
-        try:  
-            _, records = self.show_tasks()
-            id_list = [record[0] for record in records]
-            if id not in id_list:
-                raise ValueError (f'The id {id} is not in the database.')
-        except ValueError as e:
-            print (e)
+        # Ids are signed 64-bit integers; larger values cannot be bound to a query.
+        if not (-2**63 <= id < 2**63):
+            print (f'The id {id} is not in the database.')
             return None
         return id
-        
 
-    def show_tasks(self):
+
+    def formatted_tasks(self):
         """
-        Fetches and returns all tasks from the database.
+        Yields all tasks as display lines, ordered by priority and then by id.
 
-        Retrieves all tasks stored in the database, returning both a list of task names and a list of full records.
+        SQLite formats each row as "id | name | priority", so the caller only has to write the text out. Rows are streamed from their own cursor instead of being loaded into a list first.
 
-        Returns:
-        - tuple: A tuple containing:
-            - list: A list of task names.
-            - list: A list of tuples, each representing a complete task record (id, name, priority).
+        Yields:
+        - str: One line per task.
         """
-        task_name = []
-        self.c.execute ("SELECT * FROM tasks")
-        records = self.c.fetchall()
-        for record in records:
-            task_name.append(record[1])
-        return task_name, records
-
+        for (line,) in self.conn.execute(self._sql_select_formatted):
+            yield line
 
     def find_task (self, name):
         """
         Searches for a task by name in the database.
 
-        Iterates over all tasks to find a record that matches or contains the specified name, ignoring case and extra spaces.
+        Looks up the record whose name matches the specified name, ignoring case and extra spaces. Names are stored stripped, so the lookup is a single probe of the case-insensitive name index.
 
         Args:
-            name (str): The name (or partial name) of the task to search for.
+            name (str): The name of the task to search for.
 
         Returns:
             tuple or None: The full task record (id, name, priority) if found; otherwise, None.
         """
 
-        present_record = None
-        _, records = self.show_tasks()
-        for record in records:
-            if name in record[1].strip().lower():
-                present_record = record
-
-        return present_record
+        self.c.execute(self._sql_find_name, (name.strip(),))
+        return self.c.fetchone()
     
     
     def change_priority(self):
         """
         Prompts the user to change the priority of an existing task in the database.
 
-        The method repeatedly asks for a new priority and task ID until valid inputs are provided. It then updates the priority of the task with the specified ID in the database.
+        The method repeatedly asks for a new priority and task ID until valid inputs are provided. The UPDATE itself reports whether the task exists, so an unknown ID is asked for again without a separate lookup.
 
         Raises:
             ValueError: If the user inputs invalid priority or task ID.
@@ -207,13 +273,15 @@ class ToDo:
 
             while True:
                 id = input("Enter the task id: ")
-                validated_id = self.validate_id(id)
-                if validated_id is not None:
-                    break
-
-            # if validated_new_priority is not None and validated_id is not None:
-            self.c.execute("UPDATE tasks SET priority = ? WHERE id = ?", (validated_new_priority, validated_id))
-            self.conn.commit()
+                validated_id = self.parse_id(id)
+                if validated_id is None:
+                    continue
+                with self.conn:
+                    self.c.execute(self._sql_update_priority, (validated_new_priority, validated_id))
+                if self.c.rowcount == 0:
+                    print (f'The id {validated_id} is not in the database.')
+                    continue
+                break
         except ValueError as e:
             print (e)
         except:
@@ -224,25 +292,29 @@ class ToDo:
 
     def add_task(self):
         """
-        Prompts the user to enter a task name and priority, validates the inputs, and adds the task to the database.
+        Prompts the user to enter one or more task names and a priority, validates the inputs, and adds the tasks to the database.
 
-        The method ensures that the task name is unique and that the priority is within the acceptable range (1 to 10). If valid inputs are provided, the task is inserted into the 'tasks' table in the database.
+        Several tasks can be entered at once by separating their names with commas; they all get the same priority and are inserted in a single transaction. The method ensures that every task name is unique and that the priority is within the acceptable range (1 to 10).
 
         Raises:
             Exception: If there is an error during task addition (e.g., database issues).
 
         Side Effects:
-            Adds a new task to the 'tasks' table in the database with the specified name and priority.
+            Adds the new tasks to the 'tasks' table in the database with the specified names and priority.
         """
 
         try:
             while True:
-                # Take input for task name.
-                name = input("Enter a task name: ").strip().lower()
-                # Validate name.
-                validated_name = self.validate_task_name(name)
-                if validated_name is not None:
-                    break
+                # Take input for task names.
+                names = [name.strip().lower() for name in input("Enter a task name (separate several tasks with commas): ").split(",")]
+                # Validate every name, including duplicates within the batch itself.
+                validated_names = [self.validate_task_name(name) for name in names]
+                if None in validated_names:
+                    continue
+                if len(set(validated_names)) != len(validated_names):
+                    print ("The same task name has been entered more than once.")
+                    continue
+                break
 
             while True:
             # Take input for priority.
@@ -253,40 +325,94 @@ class ToDo:
                     break
         except Exception as e:
             print (e)
-            return none
+            return None
         else:
-            # If the validation is passed, entered the name and priority in the database.
-            self.c.execute("INSERT INTO tasks (name, priority) VALUES (?, ?)", (validated_name, validated_priority))
-            self.conn.commit()
-            print (f'{name}, and {priority} has been successfully entered into the database.')
-    
-    
+            # If the validation is passed, entered the names and priority in the database.
+            try:
+                self.add_tasks_bulk([(name, validated_priority) for name in validated_names])
+            except sqlite3.IntegrityError:
+                # Another connection added one of the names after validation.
+                existing = [name for name in validated_names if self.find_task(name) is not None]
+                print (f'The {", ".join(existing)} is already in the todo list. None of the tasks have been added.')
+                self.load_task_cache()
+                return None
+            print (f'{", ".join(validated_names)}, and {priority} has been successfully entered into the database.')
+
+
+    def add_tasks_bulk(self, rows):
+        """
+        Inserts several tasks into the database in a single transaction.
+
+        Parameters:
+        - rows (list): A list of (name, priority) tuples that have already been validated.
+
+        Raises:
+            sqlite3.IntegrityError: If one of the names is already in the database; no task is inserted in that case.
+        """
+        with self.conn:
+            self.c.executemany(self._sql_insert, rows)
+            # Nothing else can write while the transaction is open, so the newest rows are ours.
+            self.c.execute(self._sql_select_newest, (len(rows),))
+            new_tasks = self.c.fetchall()
+        for id, name in new_tasks:
+            self._names_by_id[id] = name.lower()
+            self._name_set.add(name.lower())
+
+
     def delete_task (self):
         """
-        Prompts the user to enter a task ID, validates the ID, and deletes the corresponding task from the database.
+        Prompts the user to enter one or more task IDs, validates them, and deletes the corresponding tasks from the database.
 
-        The method checks if the provided ID exists in the database and ensures it is a valid integer. If the ID is valid, the task is removed from the 'tasks' table. If validation fails, no task is deleted.
+        Several IDs can be entered at once by separating them with commas. The method checks that every ID is a valid integer and lets the DELETE itself report whether they all exist; if any of them fails, no task is deleted.
 
         Raises:
             ValueError: If the provided ID is invalid or not found in the database.
 
         Side Effects:
-            Deletes a task from the 'tasks' table in the database.
+            Deletes tasks from the 'tasks' table in the database.
         """
 
         try:
-            id_to_delete = input("Enter id to delete: ")
-            validated_id = self.validate_id(id_to_delete)
+            ids_to_delete = input("Enter id to delete (separate several ids with commas): ").split(",")
+            validated_ids = [self.parse_id(id.strip()) for id in ids_to_delete]
+            if None not in validated_ids:
+                # Each id once, in the order entered; this is what delete_tasks removes.
+                validated_ids = list(dict.fromkeys(validated_ids))
+                self.delete_tasks(validated_ids)
         except ValueError as e:
             print (e)
+            print ('None of the entries have been deleted.')
         else:
-            if validated_id is not None:
-                self.c.execute("DELETE FROM tasks WHERE id =?", (validated_id,))
-                self.conn.commit()
-                print (f'The entries with "{validated_id}" has been deleted.')
+            if None not in validated_ids:
+                print (f'The entries with "{", ".join(map(str, validated_ids))}" has been deleted.')
             else:
                 print ('None of the entries have been deleted.')
 
+
+    def delete_tasks(self, ids):
+        """
+        Deletes several tasks from the database with a single statement.
+
+        Parameters:
+        - ids (list): The IDs of the tasks to delete.
+
+        Returns:
+        - int: The number of deleted tasks.
+
+        Raises:
+            ValueError: If any of the IDs is not in the database; no task is deleted in that case.
+        """
+        ids = set(ids)
+        placeholders = ", ".join("?" * len(ids))
+        with self.conn:
+            self.c.execute(f"DELETE FROM tasks WHERE id IN ({placeholders})", list(ids))
+            # Raising inside the block rolls the whole delete back.
+            if self.c.rowcount != len(ids):
+                raise ValueError (f'Not all of the ids {", ".join(map(str, sorted(ids)))} are in the database.')
+        for id in ids:
+            self._name_set.discard(self._names_by_id.pop(id, None))
+        return self.c.rowcount
+
     def print_menu (self):
         """
         Prints the header and main menu options for the ToDo application.
@@ -296,22 +422,13 @@ class ToDo:
         Side Effects:
             Prints the menu and header to the console.
         """
-        # Print header.
-        print ("+" +"-" * 50 + "+")
-        print ("|                  ToDo Application                |")
-        print ("+" +"-" * 50 + "+")
-        print ("M E N U")
-        print ("1. Show tasks")
-        print ("2. Add Task")
-        print ("3. Change priority")
-        print ("4. Delete task")
-        print ("5. Exit")
+        sys.stdout.write(_MENU_TEXT)
 
     def read_user_choice (self):
         """
         Reads and validates the user's menu choice input.
 
-        This method prompts the user to enter a choice between 1 and 5, corresponding to the available options in the ToDo application. If the input is invalid (either non-numeric or outside the valid range), an error message is displayed, and the input is not accepted.
+        This method prompts the user to enter a choice between 1 and 5, corresponding to the available options in the ToDo application. If the input is invalid (either non-numeric or outside the valid range), an error message is displayed and the user is asked again.
 
         Returns:
             str: The validated user choice as a string.
@@ -320,13 +437,11 @@ class ToDo:
             Prints error messages to the console if the input is invalid.
         """
 
-        try:
-            choice  = int(input("Enter your choice(0..5):  "))
-            if choice not in list(range(1, 6)):
-                raise ValueError ("Enter a number to choose an option as shown in menu.")
-        except ValueError as e:
-            print (e)
-        return str(choice)
+        while True:
+            choice = input("Enter your choice(0..5):  ").strip()
+            if choice in _VALID_CHOICES:
+                return choice
+            print ("Enter a number to choose an option as shown in menu.")
 
 
 